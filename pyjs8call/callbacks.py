@@ -199,9 +199,9 @@ class Callbacks:
         Args:
             callback (func): Function to remove
         '''
-        for cmd, callbacks in self.commands.items():
+        for callbacks in self.commands.values():
             if callback in callbacks:
-                self.commands[cmd].remove(callback)
+                callbacks.remove(callback)
 
     def register_spots(self, callback):
         '''Register spots callback.
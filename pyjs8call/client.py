@@ -1527,9 +1527,7 @@ class Client:
                     text = data['text'][first_space:]
 
                     # look for command at begining of text to confirm destination/text split is correct
-                    commands = Message.COMMANDS.copy()
-                    commands.remove(Message.CMD_FREETEXT)
-                    commands.remove(Message.CMD_FREETEXT_2)
+                    commands = Message.COMMANDS - {Message.CMD_FREETEXT, Message.CMD_FREETEXT_2}
 
                     for cmd in commands:
                         if text.find(cmd) == 0:
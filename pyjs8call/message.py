@@ -33,8 +33,22 @@ import time
 import math
 import base64
 import secrets
+import itertools
+import operator
+import functools
 from datetime import datetime, timezone
 
+try:
+    # optional, faster json encoding and decoding
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 
 BASE64_ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
 '''Base64 characters for mapping to JS8Call supported characters'''
@@ -44,6 +58,46 @@ BASE64_TO_JS8CALL_TRANSLATION_TABLE = str.maketrans(BASE64_ALPHABET, JS8CALL_BAS
 '''Translation table from JS8Call supported characters to Base64 characters'''
 JS8CALL_TO_BASE64_TRANSLATION_TABLE = str.maketrans(JS8CALL_BASE64_ALPHABET, BASE64_ALPHABET)
 '''Translation table from Base64 characters to JS8Call supported characters'''
+BASE64_TO_JS8CALL_BYTES_TRANSLATION_TABLE = bytes.maketrans(BASE64_ALPHABET.encode(), JS8CALL_BASE64_ALPHABET.encode())
+'''Byte string translation table from Base64 characters to JS8Call supported characters'''
+JS8CALL_TO_BASE64_BYTES_TRANSLATION_TABLE = bytes.maketrans(JS8CALL_BASE64_ALPHABET.encode(), BASE64_ALPHABET.encode())
+'''Byte string translation table from JS8Call supported characters to Base64 characters'''
+
+_MSG_ID_PREFIX = secrets.token_urlsafe(6)
+# per-process message id counter, next() is atomic under the GIL
+_msg_id_counter = itertools.count()
+
+# activity item field getters, retrieve all fields in a single call
+_INBOX_PARAMS_GETTER = operator.itemgetter('CMD', 'DIAL', 'OFFSET', 'SNR', 'SUBMODE', 'UTC', 'FROM', 'TO', 'PATH', 'TEXT')
+_CALL_ACTIVITY_GETTER = operator.itemgetter('GRID', 'SNR', 'UTC')
+_BAND_ACTIVITY_GETTER = operator.itemgetter('DIAL', 'OFFSET', 'SNR', 'UTC', 'TEXT')
+
+def _upper(text):
+    '''Uppercase text, skipping the copy if already uppercase.'''
+    return text if text.isupper() else text.upper()
+
+def _time_strs(timestamp):
+    '''Get UTC and local time strings for the given epoch timestamp.'''
+    # time strings have one second resolution, repeated seconds are served from cache
+    return _whole_second_time_strs(int(timestamp))
+
+def _utc_str_timestamp(utc):
+    '''Get epoch timestamp from UTC date/time string (ex. '2023-01-31 21:42:07').'''
+    try:
+        # fixed format, slicing avoids the cost of datetime.strptime
+        dt_utc = datetime(int(utc[0:4]), int(utc[5:7]), int(utc[8:10]), int(utc[11:13]), int(utc[14:16]), int(utc[17:19]), tzinfo=timezone.utc)
+    except ValueError:
+        dt_utc = datetime.strptime(utc, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
+
+    return dt_utc.timestamp()
+
+@functools.lru_cache(maxsize=1024)
+def _whole_second_time_strs(seconds):
+    '''Get UTC and local time strings for the given epoch seconds.'''
+    utc_time_str = f"{time.strftime('%X', time.gmtime(seconds))} UTC"
+    local_time_str = f"{time.strftime('%X', time.localtime(seconds))}L"
+    return (utc_time_str, local_time_str)
+
 
 class Message:
     '''Message object for incoming and outgoing messages.
@@ -51,7 +105,7 @@ class Message:
     Most attributes with a default value of None are included so messages can be handled internally without worrying about the nuances of JS8Call API message attributes, which vary greatly.
 
     Attributes:
-        id (str): Random url-safe text string, 16 bytes in length
+        id (str): Unique url-safe text string (random per-process prefix and message counter)
         type (str): Message type (see static types), defaults to TX_SEND_MESSAGE
         destination (str): Destination callsign
         value (str): Message contents
@@ -136,16 +190,19 @@ class Message:
     MODE_SPEED              = 'MODE.SPEED'
     LOG_QSO                 = 'LOG.QSO'
     
-    TX_TYPES = [RX_GET_TEXT, RX_GET_CALL_ACTIVITY, RX_GET_BAND_ACTIVITY, RX_GET_SELECTED_CALL, TX_SEND_MESSAGE, TX_GET_TEXT, TX_SET_TEXT, MODE_GET_SPEED,
+    # frozensets for fast membership testing
+    TX_TYPES = frozenset([RX_GET_TEXT, RX_GET_CALL_ACTIVITY, RX_GET_BAND_ACTIVITY, RX_GET_SELECTED_CALL, TX_SEND_MESSAGE, TX_GET_TEXT, TX_SET_TEXT, MODE_GET_SPEED,
         MODE_SET_SPEED, STATION_GET_INFO, STATION_SET_INFO, STATION_GET_GRID, STATION_SET_GRID, STATION_GET_CALLSIGN, INBOX_GET_MESSAGES, INBOX_STORE_MESSAGE,
-        RIG_GET_FREQ, RIG_SET_FREQ, WINDOW_RAISE]
+        RIG_GET_FREQ, RIG_SET_FREQ, WINDOW_RAISE])
     
-    RX_TYPES = [MESSAGES, INBOX_MESSAGE, INBOX_MESSAGES, RX_SPOT, RX_DIRECTED, RX_DIRECTED_ME, RX_SELECTED_CALL, RX_CALL_ACTIVITY, RX_BAND_ACTIVITY,
-        RX_ACTIVITY, RX_TEXT, TX_TEXT, TX_FRAME, RIG_FREQ, RIG_PTT, STATION_CALLSIGN, STATION_GRID, STATION_INFO, STATION_STATUS, MODE_SPEED, LOG_QSO]
+    RX_TYPES = frozenset([MESSAGES, INBOX_MESSAGE, INBOX_MESSAGES, RX_SPOT, RX_DIRECTED, RX_DIRECTED_ME, RX_SELECTED_CALL, RX_CALL_ACTIVITY, RX_BAND_ACTIVITY,
+        RX_ACTIVITY, RX_TEXT, TX_TEXT, TX_FRAME, RIG_FREQ, RIG_PTT, STATION_CALLSIGN, STATION_GRID, STATION_INFO, STATION_STATUS, MODE_SPEED, LOG_QSO])
 
-    TYPES = TX_TYPES + RX_TYPES
-    DIRECTED_TYPES = [RX_DIRECTED, RX_DIRECTED_ME]
-    USER_MSG_TYPES = DIRECTED_TYPES + [TX_SEND_MESSAGE]
+    TYPES = TX_TYPES | RX_TYPES
+    # canonical type strings, parsed types are mapped to the static type objects (see Message.parse)
+    _TYPE_STRINGS = {msg_type: msg_type for msg_type in TYPES}
+    DIRECTED_TYPES = frozenset([RX_DIRECTED, RX_DIRECTED_ME])
+    USER_MSG_TYPES = DIRECTED_TYPES | {TX_SEND_MESSAGE}
 
     # command types
     CMD_HB                  = ' HB'
@@ -189,17 +246,19 @@ class Message:
     CMD_FREETEXT_2          = '  '
     '''2x space'''
 
-    COMMANDS = [CMD_HB, CMD_HEARTBEAT, CMD_HEARTBEAT_SNR, CMD_CQ, CMD_SNR_Q, CMD_Q, CMD_GRID_Q, CMD_GRID, CMD_INFO_Q, CMD_INFO, CMD_STATUS_Q,
+    COMMANDS = frozenset([CMD_HB, CMD_HEARTBEAT, CMD_HEARTBEAT_SNR, CMD_CQ, CMD_SNR_Q, CMD_Q, CMD_GRID_Q, CMD_GRID, CMD_INFO_Q, CMD_INFO, CMD_STATUS_Q,
         CMD_STATUS, CMD_HEARING_Q, CMD_HEARING, CMD_HW_CPY_Q, CMD_MSG, CMD_MSG_TO, CMD_QUERY, CMD_QUERY_MSGS, CMD_QUERY_MSGS_Q, CMD_QUERY_CALL,
         CMD_NO, CMD_YES, CMD_AGN_Q, CMD_ACK, CMD_NACK, CMD_DIT_DIT, CMD_FB, CMD_SK, CMD_RR, CMD_QSL, CMD_QSL_Q, CMD_CMD, CMD_SNR, CMD_73,
-        CMD_RELAY, CMD_FREETEXT, CMD_FREETEXT_2]
+        CMD_RELAY, CMD_FREETEXT, CMD_FREETEXT_2])
+    # canonical command strings, parsed commands are mapped to the static command objects (see Message.parse)
+    _COMMAND_STRINGS = {cmd: cmd for cmd in COMMANDS}
 
-    QUERY_COMMANDS = [CMD_SNR_Q, CMD_Q, CMD_HEARING_Q, CMD_GRID_Q, CMD_STATUS_Q, CMD_MSG, CMD_MSG_TO, CMD_QUERY, CMD_QUERY_MSGS,
-        CMD_QUERY_MSGS_Q, CMD_QUERY_CALL, CMD_INFO_Q, CMD_AGN_Q, CMD_QSL_Q, CMD_HW_CPY_Q]
+    QUERY_COMMANDS = frozenset([CMD_SNR_Q, CMD_Q, CMD_HEARING_Q, CMD_GRID_Q, CMD_STATUS_Q, CMD_MSG, CMD_MSG_TO, CMD_QUERY, CMD_QUERY_MSGS,
+        CMD_QUERY_MSGS_Q, CMD_QUERY_CALL, CMD_INFO_Q, CMD_AGN_Q, CMD_QSL_Q, CMD_HW_CPY_Q])
 
-    AUTOREPLY_COMMANDS = [CMD_HEARTBEAT_SNR, CMD_SNR, CMD_GRID, CMD_INFO, CMD_STATUS, CMD_HEARING, CMD_NO, CMD_YES, CMD_ACK, CMD_NACK]
+    AUTOREPLY_COMMANDS = frozenset([CMD_HEARTBEAT_SNR, CMD_SNR, CMD_GRID, CMD_INFO, CMD_STATUS, CMD_HEARING, CMD_NO, CMD_YES, CMD_ACK, CMD_NACK])
 
-    CHECKSUM_COMMANDS = [CMD_RELAY, CMD_MSG, CMD_MSG_TO, CMD_QUERY, CMD_QUERY_CALL, CMD_CMD]
+    CHECKSUM_COMMANDS = frozenset([CMD_RELAY, CMD_MSG, CMD_MSG_TO, CMD_QUERY, CMD_QUERY_CALL, CMD_CMD])
 
     # status types
     STATUS_CREATED          = 'created'
@@ -210,12 +269,14 @@ class Message:
     STATUS_RECEIVED         = 'received'
     STATUS_ERROR            = 'error'
 
-    STATUSES = [STATUS_CREATED, STATUS_QUEUED, STATUS_SENDING, STATUS_SENT, STATUS_FAILED, STATUS_RECEIVED, STATUS_ERROR]
+    STATUSES = frozenset([STATUS_CREATED, STATUS_QUEUED, STATUS_SENDING, STATUS_SENT, STATUS_FAILED, STATUS_RECEIVED, STATUS_ERROR])
 
     EOM = '♢'
     '''End-of-message character'''
     ERR = '…'
     '''Error character (ellipsis)'''
+    EOM_ERR_TRANSLATION_TABLE = str.maketrans({EOM: None, ERR: '...'})
+    '''Translation table removing end-of-message characters and replacing error characters with three periods'''
 
     # special group callsigns
     SPECIAL_GROUPS = [
@@ -285,6 +346,38 @@ class Message:
         "CQ"
     ]
 
+    # common message fields initialized to None
+    _COMMON_ATTRIBUTES = (
+        'freq',
+        'dial',
+        'offset',
+        'tdrift',
+        'call',
+        'grid',
+        'snr',
+        'from',
+        'origin',
+        'utc',
+        'path',
+        'text',
+        'speed',
+        'extra',
+        'hearing',
+        'messages',
+        'band_activity',
+        'call_activity',
+        'distance',
+        'distance_units',
+        'bearing',
+        'profile',
+        'error'
+    )
+    # all attributes initialized by Message.__init__, in order
+    _INIT_ATTRIBUTES = _COMMON_ATTRIBUTES + ('id', 'type', 'destination', 'cmd', 'value', 'timestamp', 'utc_time_str', 'local_time_str', 'params', 'status')
+    _INIT_ATTRIBUTE_SET = frozenset(_INIT_ATTRIBUTES)
+    # template for bulk initialization of common message fields
+    _COMMON_ATTRIBUTE_DEFAULTS = dict.fromkeys(_COMMON_ATTRIBUTES)
+
     def __init__(self, destination=None, cmd=None, value=None, origin=None):
         '''Initialize message.
 
@@ -299,8 +392,10 @@ class Message:
         Returns:
             pyjs8call.message: Constructed message object
         '''
-        self.attributes = []
+        self.attributes = list(Message._INIT_ATTRIBUTES)
         '''List of attributes set using Message.set()'''
+        # attributes set after init, see Message._INIT_ATTRIBUTES
+        self._extra_attributes = set()
         self.raw = None
         '''Raw incoming message string, defaults to None, not used for outgoing messages'''
         self.is_packed = False
@@ -309,51 +404,26 @@ class Message:
         '''Packed outgoing message string, defaults to None, not used for incoming messages'''
         self.packed_dict = None
         '''Packed outgoing message dictionary, defaults to None, not used for incoming messages'''
+        # exclude argument of the last pack, see Message.pack()
+        self._packed_exclude = None
         self._bytes = None
 
-        # initialize common msg fields
-        common = [
-            'freq',
-            'dial',
-            'offset',
-            'tdrift',
-            'call',
-            'grid',
-            'snr',
-            'from',
-            'origin',
-            'utc',
-            'path',
-            'text',
-            'speed',
-            'extra',
-            'hearing',
-            'messages',
-            'band_activity',
-            'call_activity',
-            'distance',
-            'distance_units',
-            'bearing',
-            'profile',
-            'error'
-        ]
+        # initialize common msg fields in bulk, none require special handling in Message.set()
+        self.__dict__.update(Message._COMMON_ATTRIBUTE_DEFAULTS)
 
-        for attribute in common:
-            self.set(attribute, None)
-        
-        dt_utc = datetime.now(timezone.utc)
+        timestamp = time.time()
 
-        self.set('id', secrets.token_urlsafe(16))
-        self.set('type', Message.TX_SEND_MESSAGE)
+        # attributes without special handling in Message.set() are assigned directly
+        self.id = f'{_MSG_ID_PREFIX}{next(_msg_id_counter):x}'
+        self.type = Message.TX_SEND_MESSAGE
         self.set('destination', destination)
-        self.set('cmd', cmd)
+        self.cmd = cmd
         self.set('value', value)
-        self.set('origin', origin)
-        self.set('timestamp', dt_utc.timestamp())
-        self.set('utc_time_str', '{} UTC'.format(dt_utc.strftime('%X')))
-        self.set('local_time_str', '{}L'.format(dt_utc.astimezone().strftime('%X')))
-        self.set('params', {})
-        self.set('status', Message.STATUS_CREATED)
+        self.origin = origin
+        self.timestamp = timestamp
+        self.utc_time_str, self.local_time_str = _time_strs(timestamp)
+        self.params = {}
+        self.status = Message.STATUS_CREATED
 
     def set(self, attribute, value):
         '''Set message attribute value.
@@ -374,35 +444,59 @@ class Message:
             value (any): Value of attribute to set
         '''
         attribute = attribute.lower()
-        setattr(self, attribute, value)
-
-        if attribute not in self.attributes:
-            self.attributes.append(attribute)
-
-        if attribute == 'call' and value is not None and self.get('from') is None:
-            # set 'from' = 'call' for consistency
-            self.set('from', value)
+        self._set_attribute(attribute, value)
+        # message changed, repack on next call to Message.pack()
+        self.is_packed = False
+        handler = Message._SET_HANDLERS.get(attribute)
 
-        elif attribute == 'from':
-            # Message.from cannot be called directly, use origin instead
-            self.set('origin', value)
+        if handler is not None:
+            handler(self, value)
 
-        elif attribute == 'to':
-            # set 'destination' = 'to' for consistency
-            self.set('destination', value)
+    def _set_attribute(self, attribute, value):
+        '''Set attribute value and track attribute name, without special handling.'''
+        setattr(self, attribute, value)
 
-        elif attribute == 'value' and isinstance(value, str):
-            # uppercase so tx monitor can compare to tx text field
-            self.value = value.upper()
-            self.set('text', value.upper())
+        if attribute not in Message._INIT_ATTRIBUTE_SET and attribute not in self._extra_attributes:
+            self._extra_attributes.add(attribute)
+            self.attributes.append(attribute)
 
-        # uppercase so tx monitor can compare to tx text field
-        elif attribute == 'destination' and isinstance(value, list):
+    def _set_call(self, value):
+        '''Set *from* = *call* for consistency, and *origin* = *from* (see below).'''
+        if value is not None and self.get('from') is None:
+            self._set_attribute('from', value)
+            self._set_attribute('origin', value)
+
+    def _set_from(self, value):
+        '''Set *origin* = *from*, since *Message.from* cannot be called directly.'''
+        self._set_attribute('origin', value)
+
+    def _set_to(self, value):
+        '''Set *destination* = *to* for consistency.'''
+        self.set('destination', value)
+
+    def _set_value(self, value):
+        '''Uppercase so tx monitor can compare to tx text field, and set *text* = *value*.'''
+        if isinstance(value, str):
+            value = _upper(value)
+            self.value = value
+            self._set_attribute('text', value)
+
+    def _set_destination(self, value):
+        '''Uppercase so tx monitor can compare to tx text field.'''
+        if isinstance(value, list):
             # handle relay
-            self.destination = [dest.upper() for dest in value]
-            
-        elif attribute == 'destination' and isinstance(value, str):
-            self.destination = value.upper()
+            self.destination = [_upper(dest) for dest in value]
+        elif isinstance(value, str):
+            self.destination = _upper(value)
+
+    # special attribute handling in Message.set(), see Message.set() for details
+    _SET_HANDLERS = {
+        'call': _set_call,
+        'from': _set_from,
+        'to': _set_to,
+        'value': _set_value,
+        'destination': _set_destination
+    }
 
     def get(self, attribute):
         '''Get message attribute value.
@@ -428,56 +522,63 @@ class Message:
         - For directed messages join *destination*, *cmd*, and *value* appropriately
 
         Args:
-            exclude (list): Attribute names to exclude (see *pack*), defaults to *[]*
+            exclude (list, set): Attribute names to exclude (see *pack*), defaults to *[]*
 
         Returns:
             dict: Message attributes and values
         '''
         if exclude is None:
-            exclude = []
-
-        data = {}
-        for attribute in self.attributes:
-            # skip attribues excluded or already in dict
-            if attribute in exclude or attribute in data:
-                continue
-
-            value = self.get(attribute)
-
-            # handle special cases
-            if attribute == 'value':
-                # 'value' is always included
-                if value is None:
-                    value = ''
-
-                # directed message
-                if self.type == Message.TX_SEND_MESSAGE and self.destination is not None:
-                    if isinstance(self.destination, list):
-                        # handle relay
-                        destination = Message.CMD_RELAY.join(self.destination)
-                    else:
-                        destination = self.destination
-                    
-                    if self.cmd is None:
-                        # directed message without command
-                        # note: double space!
-                        value = '{}  {}'.format(destination, value)
-                    else:
-                        # directed message with command
-                        value = '{}{} {}'.format(destination, self.cmd, value)
+            exclude = frozenset()
+        elif not isinstance(exclude, (set, frozenset)):
+            # constant time lookups in attribute loop
+            exclude = frozenset(exclude)
 
-                value = value.strip()
+        attributes = [attribute for attribute in self.attributes if attribute not in exclude]
 
-            # add to dict if value is set
-            if value is not None:
-                data[attribute] = value
+        # add to dict if value is set, 'value' is always included
+        # set attributes are instance attributes, read directly from the instance dict
+        data = {
+            attribute: value
+            for attribute, value in zip(attributes, map(self.__dict__.get, attributes))
+            if value is not None or attribute == 'value'
+        }
+
+        # handle special case outside of attribute loop
+        if 'value' in data:
+            data['value'] = self._dict_value(data['value'])
 
         return data
 
+    def _dict_value(self, value):
+        '''Get *value* as represented by *Message.dict*.'''
+        if value is None:
+            value = ''
+
+        # directed message
+        if self.type == Message.TX_SEND_MESSAGE and self.destination is not None:
+            if isinstance(self.destination, list):
+                # handle relay
+                destination = Message.CMD_RELAY.join(self.destination)
+            else:
+                destination = self.destination
+            
+            if self.cmd is None:
+                # directed message without command
+                # note: double space!
+                value = f'{destination}  {value}'
+            else:
+                # directed message with command
+                value = f'{destination}{self.cmd} {value}'
+
+        return value.strip()
+
+    # attributes excluded from packed messages by default, see Message.pack()
+    _PACK_EXCLUDE = frozenset(['id', 'destination', 'cmd', 'timestamp', 'utc_time_str', 'local_time_str', 'from', 'origin', 'text', 'status', 'profile', 'error'])
+
     def pack(self, exclude=None):
         '''Pack message for transmission over TCP socket.
 
-        If message is already packed, packed value is returned without repacking.
+        If message is already packed with the same *exclude* argument and has not been changed using *Message.set* since, packed value is returned without repacking.
 
         The following attributes are excluded by default:
         - id
@@ -497,20 +598,24 @@ class Message:
             exclude (list): Attribute names to exclude, defaults to None
             
         Returns:
-            UTF-8 encoded byte string. A dictionary representation of the message attributes is converted to a string using *json.dumps* before encoding.
+            UTF-8 encoded byte string. A dictionary representation of the message attributes is converted using *orjson.dumps* if *orjson* is installed, otherwise *json.dumps*.
         '''
-        if self.is_packed:
+        # immutable copy, so later changes to the caller's list do not match the cache
+        packed_exclude = None if exclude is None else frozenset(exclude)
+
+        if self.is_packed and packed_exclude == self._packed_exclude:
             return self.packed
-            
-        if exclude is None:
-            exclude = [] 
 
-        exclude.extend(['id', 'destination', 'cmd', 'timestamp', 'utc_time_str', 'local_time_str', 'from', 'origin', 'text', 'status', 'profile', 'error'])
+        self._packed_exclude = packed_exclude
+
+        if exclude is None:
+            exclude = Message._PACK_EXCLUDE
+        else:
+            exclude = Message._PACK_EXCLUDE.union(exclude)
 
         self.packed_dict = self.dict(exclude = exclude)
-        # convert dict to json string
-        packed = json.dumps(self.packed_dict) + '\r\n'
-        self.packed = packed.encode('utf-8')
+        # convert dict to json byte string
+        self.packed = _json_dumps(self.packed_dict) + b'\r\n'
         self.is_packed = True
         
         return self.packed
@@ -529,93 +634,54 @@ class Message:
             pyjs8call.message: self
         '''
         self.raw = msg_str
-        msg = json.loads(msg_str)
+        msg = _json_loads(msg_str)
         
         # parse top level message fields
-        self.type = msg['type'].strip()
+        msg_type = msg['type'].strip()
+        # use static type object so later type comparisons short-circuit on identity
+        self.type = Message._TYPE_STRINGS.get(msg_type, msg_type)
         
         if 'value' in msg.keys():
             self.value = msg['value'].strip()
 
         # parse paramater fields
+        params = {}
+        special_params = []
+
         for param, value in msg['params'].items():
-            param = param.strip()
+            param = param.strip().lower()
 
-            # maintain spaces before commands
-            if isinstance(value, str) and param != 'CMD':
+            if param == 'cmd':
+                # maintain spaces before commands
+                value = Message._COMMAND_STRINGS.get(value, value)
+            elif isinstance(value, str):
                 value = value.strip()
 
+            if param in Message._SET_HANDLERS:
+                special_params.append((param, value))
+            else:
+                params[param] = value
+
+        # set params without special handling in bulk
+        self.__dict__.update(params)
+        new_attributes = [param for param in params if param not in Message._INIT_ATTRIBUTE_SET and param not in self._extra_attributes]
+        self.attributes.extend(new_attributes)
+        self._extra_attributes.update(new_attributes)
+
+        for param, value in special_params:
             self.set(param, value)
         
         # type handling
-        
-        if self.type == Message.INBOX_MESSAGES:
-            self.messages = []
-            
-            for message in msg['params']['MESSAGES']:
-                dt_utc = datetime.strptime(message['params']['UTC'], '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
-
-                self.messages.append({
-                    'cmd' : message['params']['CMD'],
-                    'freq' : message['params']['DIAL'],
-                    'offset' : message['params']['OFFSET'],
-                    'snr' : message['params']['SNR'],
-                    'speed' : message['params']['SUBMODE'],
-                    'timestamp' : dt_utc.timestamp(),
-                    'utc_time_str': '{} UTC'.format(dt_utc.strftime('%X')),
-                    'local_time_str' : '{}L'.format(dt_utc.astimezone().strftime('%X')),
-                    'origin' : message['params']['FROM'],
-                    'destination' : message['params']['TO'],
-                    'path' : message['params']['PATH'],
-                    'text' : message['params']['TEXT'].strip(),
-                    'value' : message['value'],
-                    'status' : message['type'].lower(),
-                    'unread': bool(message['type'].lower() == 'unread'),
-                    'stored': bool(message['type'].lower() == 'store')
-                })
-
-        elif self.type == Message.RX_CALL_ACTIVITY:
-            self.call_activity = []
-            for key, value in msg['params'].items():
-                if key == '_ID' or value is None:
-                    continue
-
-                dt_utc = datetime.utcfromtimestamp(value['UTC'] / 1000) # milliseconds to seconds
-
-                self.call_activity.append({
-                    'origin' : key,
-                    'grid' : value['GRID'].strip(),
-                    'snr' : value['SNR'],
-                    'timestamp' : dt_utc.timestamp(),
-                    'utc_time_str' : '{} UTC'.format(dt_utc.strftime('%X')),
-                    'local_time_str' : '{}L'.format(dt_utc.astimezone().strftime('%X'))
-                })
-
-        elif self.type == Message.RX_BAND_ACTIVITY:
-            self.band_activity = []
-            for key, value in msg['params'].items():
-                try:
-                    # skip if key is not a freq offset (int)
-                    int(key)
-
-                    dt_utc = datetime.utcfromtimestamp(value['UTC'] / 1000) # milliseconds to seconds
-
-                    self.band_activity.append({
-                        'freq' : value['DIAL'],
-                        'offset' : value['OFFSET'],
-                        'snr' : value['SNR'],
-                        'timestamp' : dt_utc.timestamp(),
-                        'utc_time_str' : '{} UTC'.format(dt_utc.strftime('%X')),
-                        'local_time_str' : '{}L'.format(dt_utc.astimezone().strftime('%X')),
-                        'text' : value['TEXT']
-                    })
-                except ValueError:
-                    continue
+        parser = Message._TYPE_PARSERS.get(self.type)
+
+        if parser is not None:
+            parser(self, msg)
 
         # command handling
 
         if self.cmd == Message.CMD_GRID and self.text is not None and Message.ERR not in self.text:
-            grid = self.text.split()
+            # 0 = origin, 1 = destination, 2 = command, 3 = grid, stop splitting after grid
+            grid = self.text.split(None, 4)
             
             if len(grid) >= 4:
                 self.set('grid', grid[3])
@@ -633,6 +699,94 @@ class Message:
         # allow usage like: msg = Message().parse(rx_str)
         return self
  
+    def _parse_inbox_messages(self, msg):
+        '''Parse INBOX.MESSAGES message items.'''
+        self.messages = [Message._inbox_message_item(message) for message in msg['params']['MESSAGES']]
+
+    @staticmethod
+    def _inbox_message_item(message):
+        '''Build inbox message dictionary from INBOX.MESSAGES item.'''
+        cmd, freq, offset, snr, speed, utc, origin, destination, path, text = _INBOX_PARAMS_GETTER(message['params'])
+        status = message['type'].lower()
+        timestamp = _utc_str_timestamp(utc)
+        utc_time_str, local_time_str = _time_strs(timestamp)
+
+        return {
+            'cmd' : cmd,
+            'freq' : freq,
+            'offset' : offset,
+            'snr' : snr,
+            'speed' : speed,
+            'timestamp' : timestamp,
+            'utc_time_str': utc_time_str,
+            'local_time_str' : local_time_str,
+            'origin' : origin,
+            'destination' : destination,
+            'path' : path,
+            'text' : text.strip(),
+            'value' : message['value'],
+            'status' : status,
+            'unread': status == 'unread',
+            'stored': status == 'store'
+        }
+
+    def _parse_call_activity(self, msg):
+        '''Parse RX.CALL_ACTIVITY message items.'''
+        self.call_activity = [
+            Message._call_activity_item(key, value)
+            for key, value in msg['params'].items()
+            if key != '_ID' and value is not None
+        ]
+
+    @staticmethod
+    def _call_activity_item(origin, activity):
+        '''Build call activity dictionary from RX.CALL_ACTIVITY item.'''
+        grid, snr, utc = _CALL_ACTIVITY_GETTER(activity)
+        timestamp = utc / 1000 # milliseconds to seconds
+        utc_time_str, local_time_str = _time_strs(timestamp)
+
+        return {
+            'origin' : origin,
+            'grid' : grid.strip(),
+            'snr' : snr,
+            'timestamp' : timestamp,
+            'utc_time_str' : utc_time_str,
+            'local_time_str' : local_time_str
+        }
+
+    def _parse_band_activity(self, msg):
+        '''Parse RX.BAND_ACTIVITY message items.'''
+        self.band_activity = [
+            Message._band_activity_item(activity)
+            for key, activity in msg['params'].items()
+            # skip if key is not a freq offset (int)
+            if key.lstrip('-').isdigit()
+        ]
+
+    @staticmethod
+    def _band_activity_item(activity):
+        '''Build band activity dictionary from RX.BAND_ACTIVITY item.'''
+        freq, offset, snr, utc, text = _BAND_ACTIVITY_GETTER(activity)
+        timestamp = utc / 1000 # milliseconds to seconds
+        utc_time_str, local_time_str = _time_strs(timestamp)
+
+        return {
+            'freq' : freq,
+            'offset' : offset,
+            'snr' : snr,
+            'timestamp' : timestamp,
+            'utc_time_str' : utc_time_str,
+            'local_time_str' : local_time_str,
+            'text' : text
+        }
+
+    # message type specific parsing, see Message.parse()
+    _TYPE_PARSERS = {
+        INBOX_MESSAGES: _parse_inbox_messages,
+        RX_CALL_ACTIVITY: _parse_call_activity,
+        RX_BAND_ACTIVITY: _parse_band_activity
+    }
+ 
     def age(self):
         '''Message age in seconds.
         
@@ -666,7 +820,11 @@ class Message:
             return bool(self.is_directed() and self.destination == station.upper())
 
         elif isinstance(station, list):
-            return any( [self.is_directed_to(str(callsign)) for callsign in station] )
+            # relayed destination (list) never matches a single station
+            if not self.is_directed() or not isinstance(self.destination, str):
+                return False
+
+            return self.destination in {str(callsign).upper() for callsign in station}
 
     def is_relay(self):
         '''Message is relayed.
@@ -689,7 +847,7 @@ class Message:
         Returns:
             str: *dict* of attributes converted using *json.dumps*
         '''
-        return json.dumps( dict(zip(self.attributes, map(self.get, self.attributes))) )
+        return json.dumps( dict(zip(self.attributes, map(self.__dict__.get, self.attributes))) )
 
     def load(self, msg_str):
         '''Load object attributes from *str*.
@@ -712,14 +870,14 @@ class Message:
 
         Due to the limited character set of JS8Call, a unique process is used to re-encode JS8Call compatible text back to bytes. The text to be re-encoded is derived by *Message.decode()*.
         
-        Custom encoding process: `JS8Call compatible text -> translate to Base64 alphabet -> encode to byte string -> decode Base64 to bytes`
+        Custom encoding process: `JS8Call compatible text -> encode to byte string -> translate to Base64 alphabet -> decode Base64 to bytes`
 
         The *text* attribute is processed to support cleaning of incoming directed message text. If *text* is not set, and *value* is set, *value* is processed instead.
         
         Returns:
             bytes: Message text converted to bytes
         '''
-        global JS8CALL_TO_BASE64_TRANSLATION_TABLE
+        global JS8CALL_TO_BASE64_BYTES_TRANSLATION_TABLE
 
         if self.get('text') is not None and len(self.get('text')) > 0:
             # use msg.text if set
@@ -733,10 +891,9 @@ class Message:
             return self._bytes
 
         try:
-            # translate js8call alphabet to base46 alphabet
-            base64_text = msg_value.translate(JS8CALL_TO_BASE64_TRANSLATION_TABLE)
-            # encode to bytes
-            base64_bytes = base64_text.encode()
+            # encode to bytes, translate js8call alphabet to base64 alphabet
+            # alphabets are ascii, translating bytes is equivalent to translating text
+            base64_bytes = msg_value.encode().translate(JS8CALL_TO_BASE64_BYTES_TRANSLATION_TABLE)
             # decode base64 to bytes
             self._bytes = base64.b64decode(base64_bytes)
         except Exception as e:
@@ -749,7 +906,7 @@ class Message:
 
         Due to the limited character set of JS8Call, a unique process is used to decode bytes into JS8Call compatible text. The decoded text can be re-encoded using *Message.encode()*.
         
-        Custom decoding process: `bytes -> encode bytes to Base64 -> decode to string -> translate to JS8Call alphabet -> JS8Call compatible text`
+        Custom decoding process: `bytes -> encode bytes to Base64 -> translate to JS8Call alphabet -> decode to string -> JS8Call compatible text`
 
         Supports usage like `Message().decode(byte_string)`.
 
@@ -762,7 +919,7 @@ class Message:
         Raises:
             TypeError: *bytes_str* is not type bytes
         '''
-        global BASE64_TO_JS8CALL_TRANSLATION_TABLE
+        global BASE64_TO_JS8CALL_BYTES_TRANSLATION_TABLE
 
         if not isinstance(bytes_str, bytes):
             raise TypeError('Only type \'bytes\' can be decoded')
@@ -770,10 +927,8 @@ class Message:
         try:
             # convert bytes to base64
             base64_bytes = base64.b64encode(bytes_str)
-            # decode from bytes
-            base64_text = base64_bytes.decode()
-            # translate base64 alphabet to js8call alphabet
-            msg_value = base64_text.translate(BASE64_TO_JS8CALL_TRANSLATION_TABLE)
+            # translate base64 alphabet to js8call alphabet, decode from bytes
+            msg_value = base64_bytes.translate(BASE64_TO_JS8CALL_BYTES_TRANSLATION_TABLE).decode()
             self.set('value', msg_value)
         except Exception as e:
             self.set('value', '')
@@ -794,19 +949,22 @@ class Message:
         Returns:
             bool: *True* if the two messages are considered equal, *False* otherwise
         '''
+        if msg is self:
+            return True
+
         if not isinstance(msg, Message):
             return False
 
         # comparing origin, offset, and snr allows equating the same message sent more than once
         # from the js8call application (likely as different message types) at slightly different
         # times (likely milliseconds apart)
-        if msg.type in self.RX_TYPES:
+        if msg.type in Message.RX_TYPES:
             return bool( self.timestamp == msg.timestamp or
                 (msg.origin == self.origin and msg.offset == self.offset and msg.snr == self.snr) )
 
         else:
-            # tx types
-            return bool(msg.type == self.type and msg.value == msg.value and msg.timestamp == self.timestamp)
+            # tx types, cheap timestamp comparison first
+            return bool(msg.timestamp == self.timestamp and msg.type == self.type and msg.value == self.value)
 
     def __lt__(self, msg):
         '''Whether another message is less than self.
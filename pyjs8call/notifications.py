@@ -295,10 +295,8 @@ class Notifications:
 
         if isinstance(message, pyjs8call.Message):
             message = '{}: {}'.format(message.origin, message.text)
-            # remove end-of-message character
-            message = message.replace(pyjs8call.Message.EOM, '')
-            # replace error character
-            message = message.replace(pyjs8call.Message.ERR, '...')
+            # remove end-of-message character and replace error character in one pass
+            message = message.translate(pyjs8call.Message.EOM_ERR_TRANSLATION_TABLE)
 
         if destination_email is None:
             destination_email = self._email_destination
@@ -168,8 +168,11 @@ class OutgoingMonitor:
 
             # drop the first callsign and strip spaces and end-of-message
             # original format: 'callsign: callsign  message'
-            if ':' in tx_text:
-                tx_text = tx_text.split(':')[1].strip(' ' + Message.EOM)
+            # partition on the first colon only, message text may also contain colons
+            callsign, separator, message = tx_text.partition(':')
+
+            if separator:
+                tx_text = message.strip(' ' + Message.EOM)
             
             # update msg max age based on speed setting (60 tx cycles)
             self._msg_max_age = self._client.settings.get_window_duration() * 60